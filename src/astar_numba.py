@@ -0,0 +1,91 @@
+"""Numba-compiled A* kernel for 4-connected warehouse grids.
+
+The kernel mirrors `astar_pathfinder.astar_search` with the Manhattan
+heuristic, but works on a dense wall grid (1 = wall, 0 = free) and encodes
+each position as a flat key r * W + c so all search state lives in flat
+NumPy arrays.
+
+Returns: path (array of flat keys, empty if not found), nodes_expanded, frontier_peak
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit
+
+from heap4 import pop4, push4
+
+_push4 = njit(cache=True)(push4)
+_pop4 = njit(cache=True)(pop4)
+
+INT_MAX = 2**31 - 1
+
+# Cardinal moves in the same order as astar_search: N, E, S, W.
+_DR = np.array([-1, 0, 1, 0], dtype=np.int64)
+_DC = np.array([0, 1, 0, -1], dtype=np.int64)
+
+
+@njit(cache=True)
+def astar_nb(grid, sr, sc, gr, gc, max_exp):
+    """A* over a uint8 wall grid from (sr, sc) to (gr, gc)."""
+    H, W = grid.shape
+    n = H * W
+    g_score = np.full(n, INT_MAX, dtype=np.int32)
+    parent = np.full(n, -1, dtype=np.int32)
+    closed = np.zeros(n, dtype=np.uint8)
+
+    start = sr * W + sc
+    goal = gr * W + gc
+    g_score[start] = 0
+
+    # 4-ary heap (see heap4.py) with entries (f, tie, key).
+    tie = 0
+    frontier = [(abs(sr - gr) + abs(sc - gc), tie, start)]
+    frontier_peak = 1
+    nodes_expanded = 0
+
+    while len(frontier) > 0:
+        f, _, key = _pop4(frontier)
+
+        if key == goal:
+            length = 0
+            k = key
+            while k != -1:
+                length += 1
+                k = parent[k]
+            path = np.empty(length, dtype=np.int64)
+            k = key
+            for i in range(length - 1, -1, -1):
+                path[i] = k
+                k = parent[k]
+            return path, nodes_expanded, frontier_peak
+
+        if closed[key]:
+            continue
+
+        closed[key] = 1
+        nodes_expanded += 1
+
+        if nodes_expanded > max_exp:
+            break
+
+        r = key // W
+        c = key - r * W
+        child_g = g_score[key] + 1
+        for i in range(4):
+            nr = r + _DR[i]
+            nc = c + _DC[i]
+            if nr < 0 or nc < 0 or nr >= H or nc >= W or grid[nr, nc]:
+                continue
+            child = nr * W + nc
+            if closed[child]:
+                continue
+            if child_g < g_score[child]:
+                g_score[child] = child_g
+                parent[child] = key
+                tie += 1
+                _push4(frontier, (child_g + abs(nr - gr) + abs(nc - gc), tie, child))
+
+        if len(frontier) > frontier_peak:
+            frontier_peak = len(frontier)
+
+    return np.empty(0, dtype=np.int64), nodes_expanded, frontier_peak
@@ -9,15 +9,35 @@ Returns: path (list of positions), statistics (nodes_expanded, path_length, time
 from __future__ import annotations
 
 import heapq
+import itertools
+import math
 import time
 from typing import Callable, Dict, List, Optional, Tuple
 
+import numpy as np
+
+try:
+    from astar_numba import astar_nb
+except ImportError:
+    astar_nb = None  # type: ignore
+
 Position = Tuple[int, int]
 
+# Results keyed on (layout fingerprint, start, goal, heuristic, max_expansions).
+_ASTAR_CACHE_SIZE = 256
+# Paths are stored as tuples: compact, immutable, and nothing else refers to them.
+_astar_cache: Dict[tuple, Tuple[Optional[Tuple[Position, ...]], Dict]] = {}
+
+# Heuristic tables keyed on (layout fingerprint, goal).
+_H_TABLE_CACHE_SIZE = 64
+_h_tables: Dict[tuple, List[List[int]]] = {}
+
 
 class Node:
     """Search node with path cost and heuristic tracking."""
 
+    __slots__ = ("position", "parent", "action", "g", "h", "f")
+
     def __init__(
         self,
         position: Position,
@@ -39,9 +59,47 @@ class Node:
 
     def path(self) -> List[Position]:
         """Reconstruct path from start to this node."""
-        if self.parent is None:
-            return [self.position]
-        return self.parent.path() + [self.position]
+        out = []
+        n = self
+        while n is not None:
+            out.append(n.position)
+            n = n.parent
+        out.reverse()
+        return out
+
+
+def _reconstruct_path(parent: Dict[Position, Optional[Position]], goal: Position) -> List[Position]:
+    """Walk the parent map from goal back to start."""
+    out = []
+    pos: Optional[Position] = goal
+    while pos is not None:
+        out.append(pos)
+        pos = parent[pos]
+    out.reverse()
+    return out
+
+
+def _wall_grid(env) -> np.ndarray:
+    """Return env's walls as a contiguous uint8 array (1 = wall), cached on env."""
+    cached = getattr(env, "_astar_walls", None)
+    if cached is not None and cached[0] is env.grid:
+        return cached[1]
+    walls = np.ascontiguousarray(
+        [[ch == "#" for ch in row] for row in env.grid], dtype=np.uint8
+    )
+    env._astar_walls = (env.grid, walls)
+    return walls
+
+
+def _grid_fingerprint(env) -> Tuple[Tuple[int, ...], bytes]:
+    """Layout fingerprint for the result cache: wall grid shape and bytes."""
+    cached = getattr(env, "_astar_fp", None)
+    if cached is not None and cached[0] is env.grid:
+        return cached[1]
+    walls = _wall_grid(env)
+    fp = (walls.shape, walls.tobytes())
+    env._astar_fp = (env.grid, fp)
+    return fp
 
 
 def manhattan_distance(pos: Position, goal: Position) -> float:
@@ -49,12 +107,33 @@ def manhattan_distance(pos: Position, goal: Position) -> float:
     return abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
 
 
+def manhattan_batch(positions: np.ndarray, goal: Position) -> np.ndarray:
+    """Vectorized Manhattan distance from each row of an (N, 2) array to goal."""
+    return np.abs(np.asarray(positions) - np.asarray(goal)).sum(axis=1)
+
+
+def _heuristic_table(env, goal: Position) -> List[List[int]]:
+    """Manhattan distance to goal for every grid cell, memoized per (layout, goal)."""
+    key = (_grid_fingerprint(env), goal)
+    table = _h_tables.get(key)
+    if table is None:
+        # Score every cell in one vectorized call instead of once per child.
+        shape = _wall_grid(env).shape
+        cells = np.indices(shape).reshape(2, -1).T
+        table = manhattan_batch(cells, goal).reshape(shape).tolist()
+        if len(_h_tables) >= _H_TABLE_CACHE_SIZE:
+            del _h_tables[next(iter(_h_tables))]  # evict oldest entry
+        _h_tables[key] = table
+    return table
+
+
 def astar_search(
     start: Position,
     goal: Position,
     env,
     heuristic: Callable[[Position, Position], float] = manhattan_distance,
     max_expansions: int = 10000,
+    use_cache: bool = True,
 ) -> Tuple[Optional[List[Position]], Dict]:
     """
     A* Search for pathfinding with heuristic.
@@ -65,58 +144,115 @@ def astar_search(
         env: WarehouseEnv instance (for grid checks)
         heuristic: Function h(n) estimating distance to goal (default: Manhattan)
         max_expansions: Safety limit to prevent infinite loops
+        use_cache: Reuse the result of an identical earlier query on the same layout
 
     Returns:
         (path, stats) where path is a list of positions or None if not found,
         stats includes: nodes_expanded, path_length, time_ms, frontier_peak
     """
+    if not use_cache:
+        return _astar_search(start, goal, env, heuristic, max_expansions)
+
+    key = (_grid_fingerprint(env), start, goal, heuristic, max_expansions)
+    hit = _astar_cache.get(key)
+    if hit is None:
+        path, stats = _astar_search(start, goal, env, heuristic, max_expansions)
+        hit = (tuple(path) if path is not None else None), stats
+        if len(_astar_cache) >= _ASTAR_CACHE_SIZE:
+            del _astar_cache[next(iter(_astar_cache))]  # evict oldest entry
+        _astar_cache[key] = hit
+    path, stats = hit
+    # Hand out copies so callers can mutate the result freely.
+    return (list(path) if path is not None else None), dict(stats)
+
+
+def _astar_search(
+    start: Position,
+    goal: Position,
+    env,
+    heuristic: Callable[[Position, Position], float],
+    max_expansions: int,
+) -> Tuple[Optional[List[Position]], Dict]:
+    """Uncached A* search; see `astar_search`."""
     start_time = time.time()
-    h_start = heuristic(start, goal)
-    start_node = Node(start, g=0, h=h_start)
+
+    if astar_nb is not None and heuristic is manhattan_distance:
+        walls = _wall_grid(env)
+        keys, nodes_expanded, frontier_peak = astar_nb(
+            walls, start[0], start[1], goal[0], goal[1], max_expansions
+        )
+        W = walls.shape[1]
+        path = [divmod(int(k), W) for k in keys] or None
+        elapsed = time.time() - start_time
+        return path, {
+            "nodes_expanded": int(nodes_expanded),
+            "path_length": len(path) if path else None,
+            "time_ms": elapsed * 1000,
+            "frontier_peak": int(frontier_peak),
+        }
+
+    if heuristic is manhattan_distance:
+        h_table = _heuristic_table(env, goal)
+
+        def heuristic(pos: Position, _goal: Position) -> float:
+            return h_table[pos[0]][pos[1]]
+
+    tie = itertools.count()
+
+    # Closed set and g-scores are flat arrays indexed by r * W + c, so
+    # membership tests are a single index instead of hashing a tuple.
+    W = env.width
+    closed = bytearray(env.height * W)
+    g_score = [math.inf] * (env.height * W)
+    g_score[start[0] * W + start[1]] = 0
+    parent: Dict[Position, Optional[Position]] = {start: None}
 
     frontier = []
-    heapq.heappush(frontier, (start_node.f, id(start_node), start_node))
+    heapq.heappush(frontier, (heuristic(start, goal), next(tie), start))
+    MOVES = tuple(env.MOVE_DELTAS[a] for a in ("N", "E", "S", "W"))
+    is_wall = env._is_wall
 
-    explored = set()
     frontier_peak = 1
     nodes_expanded = 0
 
     while frontier:
-        f, _, node = heapq.heappop(frontier)
+        f, _, pos = heapq.heappop(frontier)
 
-        if node.position == goal:
+        if pos == goal:
             elapsed = time.time() - start_time
-            return node.path(), {
+            path = _reconstruct_path(parent, goal)
+            return path, {
                 "nodes_expanded": nodes_expanded,
-                "path_length": len(node.path()),
+                "path_length": len(path),
                 "time_ms": elapsed * 1000,
                 "frontier_peak": frontier_peak,
             }
 
-        if node.position in explored:
+        r, c = pos
+        key = r * W + c
+        if closed[key]:
             continue
 
-        explored.add(node.position)
+        closed[key] = 1
         nodes_expanded += 1
 
         if nodes_expanded > max_expansions:
             break
 
         # Expand neighbors (cardinal moves)
-        r, c = node.position
-        for act in ["N", "E", "S", "W"]:
-            dr, dc = env.MOVE_DELTAS[act]
+        child_g = g_score[key] + 1  # Each move costs 1
+        for dr, dc in MOVES:
             nr, nc = r + dr, c + dc
-            if env._is_wall(nr, nc):
+            if is_wall(nr, nc):
                 continue
-            child_pos = (nr, nc)
-            if child_pos in explored:
+            child_key = nr * W + nc
+            if closed[child_key]:
                 continue
-
-            child_g = node.g + 1  # Each move costs 1
-            child_h = heuristic(child_pos, goal)
-            child_node = Node(child_pos, parent=node, action=act, g=child_g, h=child_h)
-            heapq.heappush(frontier, (child_node.f, id(child_node), child_node))
+            if child_g < g_score[child_key]:
+                child_pos = (nr, nc)
+                g_score[child_key] = child_g
+                parent[child_pos] = pos
+                heapq.heappush(frontier, (child_g + heuristic(child_pos, goal), next(tie), child_pos))
 
         frontier_peak = max(frontier_peak, len(frontier))
 
@@ -129,6 +265,109 @@ def astar_search(
     }
 
 
+def bidirectional_astar(
+    start: Position,
+    goal: Position,
+    env,
+    heuristic: Callable[[Position, Position], float] = manhattan_distance,
+    max_expansions: int = 10000,
+) -> Tuple[Optional[List[Position]], Dict]:
+    """
+    Bidirectional A*: search forward from start and backward from goal at once.
+
+    Each step expands the side whose frontier has the smaller top f-value.
+    Whenever a generated node already has a g-score from the opposite side,
+    the best meeting cost is updated. The search stops once either frontier's
+    top f-value reaches the best meeting cost, which keeps the result optimal
+    for a consistent heuristic.
+
+    Args and returns match `astar_search`; stats count expansions and
+    frontier sizes over both directions.
+    """
+    start_time = time.time()
+    tie = itertools.count()
+
+    W = env.width
+    size = env.height * W
+    g_score = ([math.inf] * size, [math.inf] * size)
+    closed = (bytearray(size), bytearray(size))
+    parent: Tuple[Dict[Position, Optional[Position]], ...] = ({start: None}, {goal: None})
+    targets = (goal, start)
+    g_score[0][start[0] * W + start[1]] = 0
+    g_score[1][goal[0] * W + goal[1]] = 0
+
+    frontiers = (
+        [(heuristic(start, goal), next(tie), start)],
+        [(heuristic(goal, start), next(tie), goal)],
+    )
+    MOVES = tuple(env.MOVE_DELTAS[a] for a in ("N", "E", "S", "W"))
+    is_wall = env._is_wall
+    best_cost = 0 if start == goal else math.inf
+    meet: Optional[Position] = start if start == goal else None
+    frontier_peak = 2
+    nodes_expanded = 0
+
+    while frontiers[0] and frontiers[1]:
+        top_fwd, top_bwd = frontiers[0][0][0], frontiers[1][0][0]
+        if max(top_fwd, top_bwd) >= best_cost:
+            break
+
+        side = 0 if top_fwd <= top_bwd else 1
+        frontier = frontiers[side]
+        own_g, other_g = g_score[side], g_score[1 - side]
+        own_closed = closed[side]
+
+        _, _, pos = heapq.heappop(frontier)
+        r, c = pos
+        key = r * W + c
+        if own_closed[key]:
+            continue
+
+        own_closed[key] = 1
+        nodes_expanded += 1
+
+        if nodes_expanded > max_expansions:
+            break
+
+        child_g = own_g[key] + 1  # Each move costs 1
+        for dr, dc in MOVES:
+            nr, nc = r + dr, c + dc
+            if is_wall(nr, nc):
+                continue
+            child_key = nr * W + nc
+            if own_closed[child_key]:
+                continue
+            if child_g < own_g[child_key]:
+                child_pos = (nr, nc)
+                own_g[child_key] = child_g
+                parent[side][child_pos] = pos
+                heapq.heappush(frontier, (child_g + heuristic(child_pos, targets[side]), next(tie), child_pos))
+                if child_g + other_g[child_key] < best_cost:
+                    best_cost = child_g + other_g[child_key]
+                    meet = child_pos
+
+        frontier_peak = max(frontier_peak, len(frontiers[0]) + len(frontiers[1]))
+
+    elapsed = time.time() - start_time
+    if meet is None:
+        return None, {
+            "nodes_expanded": nodes_expanded,
+            "path_length": None,
+            "time_ms": elapsed * 1000,
+            "frontier_peak": frontier_peak,
+        }
+
+    backward = _reconstruct_path(parent[1], meet)
+    backward.reverse()
+    path = _reconstruct_path(parent[0], meet) + backward[1:]
+    return path, {
+        "nodes_expanded": nodes_expanded,
+        "path_length": len(path),
+        "time_ms": elapsed * 1000,
+        "frontier_peak": frontier_peak,
+    }
+
+
 if __name__ == "__main__":
     from warehouse_env import WarehouseEnv
 
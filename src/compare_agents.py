@@ -13,6 +13,7 @@ Returns statistics dictionary for both agents.
 from __future__ import annotations
 
 import argparse
+import inspect
 import random
 import sys
 from pathlib import Path
@@ -39,15 +40,17 @@ def run_n_episodes(agent_cls, num_episodes: int = 50, seed: int | None = None, r
         "battery": [],
         "reward": [],
     }
+    # Decide once whether the agent constructor takes a seed.
+    accepts_seed = "seed" in inspect.signature(agent_cls.__init__).parameters
     for i in range(num_episodes):
         # Seed random for reproducible environment randomization
         s = None if seed is None else seed + i
         if s is not None:
             random.seed(s)
         env = WarehouseEnv()
-        agent = agent_cls(seed=s) if agent_cls is ReflexAgent or agent_cls is GreedyManhattanAgent else agent_cls()
-        agent.reset()
+        agent = agent_cls(seed=s) if accepts_seed else agent_cls()
         obs = env.reset(randomize=randomize)
+        agent.reset(env)
         total_reward = 0.0
         steps = 0
         terminated = False
@@ -5,11 +5,12 @@ saves best-final layout visualizations.
 """
 from __future__ import annotations
 
+import multiprocessing
 import os
 import random
-import statistics
 from typing import List
 
+import numpy as np
 import matplotlib
 matplotlib.use("Agg")
 import matplotlib.pyplot as plt
@@ -17,17 +18,20 @@ import matplotlib.pyplot as plt
 from rack_layout import RackLayout
 from hill_climbing import steepest_ascent
 from simulated_annealing import simulated_annealing
-from genetic_algorithm import genetic_algorithm
+from genetic_algorithm import island_ga
 
 
 OUT_DIR = os.path.join(os.path.dirname(__file__), "..", "out")
 os.makedirs(OUT_DIR, exist_ok=True)
 
 
-def pad_history(hist: List[float], length: int) -> List[float]:
-    if len(hist) >= length:
-        return hist[:length]
-    return hist + [hist[-1]] * (length - len(hist))
+def pad_history(hist: List[float], length: int) -> np.ndarray:
+    # Fill a preallocated buffer; the tail repeats the last recorded value
+    out = np.empty(length, dtype=np.float64)
+    n = min(len(hist), length)
+    out[:n] = hist[:n]
+    out[n:] = hist[-1] if hist else 0.0
+    return out
 
 
 def render_layout(layout: RackLayout, fname: str) -> None:
@@ -47,31 +51,31 @@ def render_layout(layout: RackLayout, fname: str) -> None:
     plt.close(fig)
 
 
+def _one_start(seed_i: int):
+    """Run hill-climbing and simulated annealing from one random start; used as a pool task."""
+    random.seed(seed_i)
+    init = RackLayout()
+    # Hill-climbing
+    hc_best, hc_hist = steepest_ascent(init, max_iters=1000)
+    # Simulated annealing
+    sa_best, sa_hist = simulated_annealing(init, T0=1.0, alpha=0.995, max_iters=2000)
+    return hc_best, hc_hist, sa_best, sa_hist
+
+
 def run_comparison(num_starts: int = 20, seed: int = 0):
-    random.seed(seed)
-    hc_histories = []
-    sa_histories = []
-    ga_histories = []
-    hc_bests = []
-    sa_bests = []
-    ga_bests = []
-
-    for i in range(num_starts):
-        init = RackLayout()
-        # Hill-climbing
-        hc_best, hc_hist = steepest_ascent(init, max_iters=1000)
-        hc_histories.append(hc_hist)
-        hc_bests.append(hc_best)
-
-        # Simulated annealing
-        sa_best, sa_hist = simulated_annealing(init, T0=1.0, alpha=0.995, max_iters=2000)
-        sa_histories.append(sa_hist)
-        sa_bests.append(sa_best)
-
-        # Genetic algorithm (population-randomized)
-        ga_best, ga_hist = genetic_algorithm(pop_size=30, generations=200)
-        ga_histories.append(ga_hist)
-        ga_bests.append(ga_best)
+    # Starts are independent, so run them in worker processes. Each start
+    # gets its own seed drawn from `seed` to keep results reproducible.
+    rng = random.Random(seed)
+    start_seeds = [rng.randrange(2**32) for _ in range(num_starts)]
+    with multiprocessing.Pool() as pool:
+        results = pool.map(_one_start, start_seeds)
+    hc_bests, hc_histories, sa_bests, sa_histories = map(list, zip(*results))
+
+    # Genetic algorithm: one island-model run with an island per start.
+    # Migration speeds convergence, so half the generations are enough.
+    ga_best, ga_hist = island_ga(num_islands=num_starts, pop_size=30, generations=100, migrate_every=10)
+    ga_histories = [ga_hist]
+    ga_bests = [ga_best]
 
     # Determine max length for padding
     maxlen = max(max(len(h) for h in hc_histories), max(len(h) for h in sa_histories), max(len(h) for h in ga_histories))
@@ -81,9 +85,9 @@ def run_comparison(num_starts: int = 20, seed: int = 0):
     sa_padded = [pad_history(h, maxlen) for h in sa_histories]
     ga_padded = [pad_history(h, maxlen) for h in ga_histories]
 
-    hc_mean = [statistics.mean(col) for col in zip(*hc_padded)]
-    sa_mean = [statistics.mean(col) for col in zip(*sa_padded)]
-    ga_mean = [statistics.mean(col) for col in zip(*ga_padded)]
+    hc_mean = np.asarray(hc_padded, dtype=np.float64).mean(axis=0).tolist()
+    sa_mean = np.asarray(sa_padded, dtype=np.float64).mean(axis=0).tolist()
+    ga_mean = np.asarray(ga_padded, dtype=np.float64).mean(axis=0).tolist()
 
     iters = list(range(len(hc_mean)))
 
@@ -1,18 +1,27 @@
 """Genetic algorithm for RackLayout optimization."""
 from __future__ import annotations
 
+import multiprocessing
 import random
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
 
 from rack_layout import RackLayout
 
+try:
+    from rack_layout_numba import _evaluate_pop
+except ImportError:
+    _evaluate_pop = None  # type: ignore
+
 
 def crossover(parent1: RackLayout, parent2: RackLayout) -> RackLayout:
     # Order-based crossover: take first half from p1, fill remaining from p2 preserving order
     n = len(parent1.positions)
     cut = n // 2
     p1_prefix = parent1.positions[:cut]
-    p2_rest = [p for p in parent2.positions if p not in p1_prefix]
+    p1_prefix_set = set(p1_prefix)
+    p2_rest = [p for p in parent2.positions if p not in p1_prefix_set]
     child_positions = p1_prefix + p2_rest
     # Ensure uniqueness and correct length
     if len(child_positions) != n:
@@ -21,35 +30,125 @@ def crossover(parent1: RackLayout, parent2: RackLayout) -> RackLayout:
     return RackLayout(positions=child_positions, grid_size=parent1.grid_size, depot=parent1.depot)
 
 
-def tournament_selection(pop: List[RackLayout], k: int = 3) -> RackLayout:
-    return min(random.sample(pop, k), key=lambda s: s.objective())
+def tournament_selection(pop: List[RackLayout], objs: Optional[np.ndarray] = None, k: int = 3) -> RackLayout:
+    # objs holds each individual's objective, precomputed once per generation
+    if objs is None:
+        objs = np.array([p.objective() for p in pop])
+    idx = random.sample(range(len(pop)), k)
+    return pop[idx[int(np.argmin(objs[idx]))]]
 
 
-def genetic_algorithm(
-    pop_size: int = 30,
-    generations: int = 200,
-    crossover_rate: float = 0.8,
-    mutation_rate: float = 0.2,
-) -> Tuple[RackLayout, List[float]]:
-    # Initialize population
-    pop = [RackLayout() for _ in range(pop_size)]
-    history = [min(p.objective() for p in pop)]
+def _pop_objectives(pop: List[RackLayout]) -> np.ndarray:
+    """Objective of every individual.
+
+    Layouts without cached distance stats (e.g. crossover children) are scored
+    together in one parallel kernel call when available; the rest reuse their
+    incremental stats.
+    """
+    if _evaluate_pop is not None:
+        fresh = [p for p in pop if p._obj is None and p._stats is None]
+        if fresh:
+            stack = np.array([p.positions for p in fresh], dtype=np.int32)
+            objs = np.empty(len(fresh))
+            depot_r, depot_c = fresh[0].depot
+            _evaluate_pop(stack, depot_r, depot_c, 2.0, objs)
+            for p, obj in zip(fresh, objs.tolist()):
+                p._obj, p._obj_lam = obj, 2.0
+    return np.array([p.objective() for p in pop])
+
+
+def _evolve(
+    pop: List[RackLayout],
+    generations: int,
+    crossover_rate: float,
+    mutation_rate: float,
+) -> Tuple[List[RackLayout], np.ndarray, List[float]]:
+    """Run `generations` GA steps on pop.
+
+    Returns (pop, objs, history), where history holds the best objective of
+    the starting population followed by the best of each generation.
+    """
+    pop_size = len(pop)
+    objs = _pop_objectives(pop)
+    history = [float(objs.min())]
     for gen in range(generations):
         new_pop: List[RackLayout] = []
         while len(new_pop) < pop_size:
             if random.random() < crossover_rate:
-                p1 = tournament_selection(pop)
-                p2 = tournament_selection(pop)
+                p1 = tournament_selection(pop, objs)
+                p2 = tournament_selection(pop, objs)
                 child = crossover(p1, p2)
             else:
-                child = tournament_selection(pop).copy()
+                child = tournament_selection(pop, objs).copy()
             if random.random() < mutation_rate:
                 child = child.mutate()
             new_pop.append(child)
         pop = new_pop
-        best = min(pop, key=lambda s: s.objective())
-        history.append(best.objective())
-    best = min(pop, key=lambda s: s.objective())
+        objs = _pop_objectives(pop)
+        history.append(float(objs.min()))
+    return pop, objs, history
+
+
+def genetic_algorithm(
+    pop_size: int = 30,
+    generations: int = 200,
+    crossover_rate: float = 0.8,
+    mutation_rate: float = 0.2,
+) -> Tuple[RackLayout, List[float]]:
+    # Initialize population
+    pop = [RackLayout() for _ in range(pop_size)]
+    pop, objs, history = _evolve(pop, generations, crossover_rate, mutation_rate)
+    best = pop[int(np.argmin(objs))]
+    return best, history
+
+
+def _evolve_island(args) -> Tuple[List[RackLayout], List[float]]:
+    """Pool task: evolve one island for a migration epoch under its own seed."""
+    pop, seed, generations, crossover_rate, mutation_rate = args
+    random.seed(seed)
+    pop, _, history = _evolve(pop, generations, crossover_rate, mutation_rate)
+    return pop, history[1:]
+
+
+def island_ga(
+    num_islands: int = 4,
+    pop_size: int = 30,
+    generations: int = 200,
+    migrate_every: int = 20,
+    crossover_rate: float = 0.8,
+    mutation_rate: float = 0.2,
+) -> Tuple[RackLayout, List[float]]:
+    """Island-model GA: independent populations with periodic migration.
+
+    Islands evolve in parallel worker processes between migrations. Every
+    `migrate_every` generations the best individual of island i replaces the
+    worst individual of island (i + 1) mod num_islands.
+
+    Returns the best layout across all islands and, per generation, the best
+    objective across all islands.
+    """
+    islands = [[RackLayout() for _ in range(pop_size)] for _ in range(num_islands)]
+    history = [min(p.objective() for island in islands for p in island)]
+    done = 0
+    with multiprocessing.Pool() as pool:
+        while done < generations:
+            epoch = min(migrate_every, generations - done)
+            # Seeds come from the parent RNG so runs stay reproducible.
+            tasks = [
+                (island, random.randrange(2**32), epoch, crossover_rate, mutation_rate)
+                for island in islands
+            ]
+            results = pool.map(_evolve_island, tasks)
+            islands = [pop for pop, _ in results]
+            history.extend(min(col) for col in zip(*(hist for _, hist in results)))
+            done += epoch
+            if done < generations:
+                migrants = [min(island, key=lambda s: s.objective()) for island in islands]
+                for i, migrant in enumerate(migrants):
+                    target = islands[(i + 1) % num_islands]
+                    worst = max(range(len(target)), key=lambda j: target[j].objective())
+                    target[worst] = migrant.copy()
+    best = min((p for island in islands for p in island), key=lambda s: s.objective())
     return best, history
 
 
@@ -0,0 +1,49 @@
+"""4-ary min-heap on a plain Python list.
+
+Same contract as `heapq.heappush` / `heapq.heappop`, but each node has four
+children (indices 4*i+1 .. 4*i+4, parent (i-1) >> 2), which halves the tree
+height. The functions are plain Python so they can also be compiled with
+`numba.njit` for use inside jitted search kernels.
+"""
+from __future__ import annotations
+
+
+def push4(heap, item) -> None:
+    """Push item onto the 4-ary heap, keeping the heap invariant."""
+    heap.append(item)
+    i = len(heap) - 1
+    while i > 0:
+        p = (i - 1) >> 2
+        if item < heap[p]:
+            heap[i] = heap[p]
+            i = p
+        else:
+            break
+    heap[i] = item
+
+
+def pop4(heap):
+    """Pop and return the smallest item from the 4-ary heap."""
+    last = heap.pop()
+    if len(heap) == 0:
+        return last
+    top = heap[0]
+    n = len(heap)
+    i = 0
+    while True:
+        first = 4 * i + 1
+        if first >= n:
+            break
+        # Pick the smallest of up to four consecutive children.
+        m = first
+        end = min(first + 4, n)
+        for j in range(first + 1, end):
+            if heap[j] < heap[m]:
+                m = j
+        if heap[m] < last:
+            heap[i] = heap[m]
+            i = m
+        else:
+            break
+    heap[i] = last
+    return top
@@ -5,8 +5,31 @@ import copy
 import math
 from typing import Tuple, List
 
+import numpy as np
+
 from rack_layout import RackLayout
 
+try:
+    from rack_layout_numba import _steepest_ascent_inner
+except ImportError:
+    _steepest_ascent_inner = None  # type: ignore
+
+
+def _neighbor_stack(layout: RackLayout) -> np.ndarray:
+    """Positions of every neighbor of layout as an (M, N, 2) array.
+
+    Neighbors are listed in the same order as `RackLayout.neighbors()`.
+    """
+    base = np.asarray(layout.positions)
+    idx, new = [], []
+    for i, p in layout.iter_moves():
+        idx.append(i)
+        new.append(p)
+    stack = np.repeat(base[None], len(idx), axis=0)
+    if idx:
+        stack[np.arange(len(idx)), idx] = new
+    return stack
+
 
 def steepest_ascent(initial: RackLayout, max_iters: int = 1000) -> Tuple[RackLayout, List[float]]:
     """Perform steepest-ascent hill-climbing (minimization of objective).
@@ -15,20 +38,53 @@ def steepest_ascent(initial: RackLayout, max_iters: int = 1000) -> Tuple[RackLay
     """
     current = initial.copy()
     history = [current.objective()]
+    if _steepest_ascent_inner is not None:
+        return _steepest_ascent_nb(current, history[0], max_iters)
+    current_obj = history[0]
     for it in range(max_iters):
-        neighs = current.neighbors()
-        if not neighs:
+        stack = _neighbor_stack(current)
+        if len(stack) == 0:
             break
-        # Evaluate neighbors and pick the one with lowest objective
-        best = min(neighs, key=lambda s: s.objective())
-        if best.objective() < current.objective():
-            current = best
-            history.append(current.objective())
+        # Score all neighbors in one batch; only the winner becomes a RackLayout
+        objs = current.objective_batch(stack)
+        i = int(np.argmin(objs))
+        best_obj = float(objs[i])
+        if best_obj < current_obj:
+            current = RackLayout(
+                positions=[tuple(p) for p in stack[i].tolist()],
+                grid_size=current.grid_size,
+                depot=current.depot,
+            )
+            current_obj = best_obj
+            current._obj, current._obj_lam = current_obj, 2.0
+            history.append(current_obj)
         else:
             break
     return current, history
 
 
+def _steepest_ascent_nb(
+    current: RackLayout, start_obj: float, max_iters: int
+) -> Tuple[RackLayout, List[float]]:
+    """Compiled-kernel version of the steepest_ascent loop.
+
+    The whole climb runs in one kernel call on a position array; a RackLayout
+    is only built for the final state.
+    """
+    positions = current.pos_arr.copy()
+    depot_r, depot_c = current.depot
+    history, current_obj = _steepest_ascent_inner(
+        positions, depot_r, depot_c, current.grid_size, 2.0, max_iters, start_obj
+    )
+    final = RackLayout(
+        positions=[tuple(p) for p in positions.tolist()],
+        grid_size=current.grid_size,
+        depot=current.depot,
+    )
+    final._obj, final._obj_lam = current_obj, 2.0
+    return final, history.tolist()
+
+
 if __name__ == "__main__":
     from rack_layout import RackLayout
     init = RackLayout()
@@ -11,7 +11,10 @@ Lower is better.
 from __future__ import annotations
 
 import random
-from typing import List, Tuple
+from functools import lru_cache
+from typing import Iterator, List, Tuple
+
+import numpy as np
 
 Position = Tuple[int, int]
 
@@ -20,62 +23,178 @@ def default_depot() -> Position:
     return (10, 10)
 
 
+@lru_cache(maxsize=None)
+def _all_cells(grid_size: int) -> Tuple[Position, ...]:
+    """Every (x, y) cell of a grid_size x grid_size grid, built once per size."""
+    return tuple((x, y) for x in range(grid_size) for y in range(grid_size))
+
+
 def manhattan(a: Position, b: Position) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
 class RackLayout:
-    def __init__(self, positions: List[Position] | None = None, grid_size: int = 20, depot: Position | None = None):
+    def __init__(
+        self,
+        positions: List[Position] | None = None,
+        grid_size: int = 20,
+        depot: Position | None = None,
+        parent_dists: np.ndarray | None = None,
+        moved_idx: int | None = None,
+        moved_pos: Position | None = None,
+    ):
         self.grid_size = grid_size
         self.depot = depot or default_depot()
         if positions is None:
             self.positions = self.random_positions()
         else:
             self.positions = positions
+        # Set view of positions for O(1) occupancy checks.
+        self._pos_set = set(self.positions)
+        # Memoized objective; positions are treated as immutable after construction.
+        self._obj: float | None = None
+        self._obj_lam = 0.0
+        # (sum of depot distances, racks within distance < 5); children produced
+        # by neighbors()/mutate() get these updated incrementally.
+        self._stats: Tuple[int, int] | None = None
+        # Per-rack depot distances. A layout that differs from its parent by one
+        # moved rack reuses the parent's vector and recomputes only that entry.
+        self._dists: np.ndarray | None = None
+        if parent_dists is not None and moved_idx is not None:
+            if moved_pos is None:
+                moved_pos = self.positions[moved_idx]
+            dists = parent_dists.copy()
+            dists[moved_idx] = manhattan(self.depot, moved_pos)
+            self._dists = dists
+
+    @property
+    def pos_arr(self) -> np.ndarray:
+        """Positions as an int32 (N, 2) array, built on first use."""
+        arr = getattr(self, "_pos_arr", None)
+        if arr is None:
+            arr = self._pos_arr = np.asarray(self.positions, dtype=np.int32)
+        return arr
 
     def random_positions(self) -> List[Position]:
-        all_cells = [(x, y) for x in range(self.grid_size) for y in range(self.grid_size)]
-        all_cells.remove(self.depot) if self.depot in all_cells else None
-        chosen = random.sample(all_cells, 20)
+        g = self.grid_size
+        if 2 * 20 > g * g - 1:
+            # Nearly full grid: rejection would stall, so sample from every cell.
+            all_cells = list(_all_cells(g))
+            all_cells.remove(self.depot) if self.depot in all_cells else None
+            return random.sample(all_cells, 20)
+        # Rejection-sample 20 distinct non-depot cells in draw order.
+        chosen: List[Position] = []
+        seen = {self.depot}
+        while len(chosen) < 20:
+            cell = (random.randrange(g), random.randrange(g))
+            if cell not in seen:
+                seen.add(cell)
+                chosen.append(cell)
         return chosen
 
     def objective(self, lam: float = 2.0) -> float:
+        if self._obj is not None and self._obj_lam == lam:
+            return self._obj
+        total, congestion = self._dist_stats()
+        self._obj = self._score(total, congestion, lam)
+        self._obj_lam = lam
+        return self._obj
+
+    def _score(self, total: int, congestion: int, lam: float = 2.0) -> float:
+        """Objective from the distance sum and congestion count."""
         # average distance to depot
-        distances = [manhattan(self.depot, p) for p in self.positions]
-        avg = sum(distances) / len(distances)
+        avg = total / len(self.positions)
         # congestion penalty: count racks within distance < 5
-        congestion = sum(1 for d in distances if d < 5)
         return (avg) + lam * congestion / 1.0
 
-    def copy(self) -> "RackLayout":
-        return RackLayout(positions=list(self.positions), grid_size=self.grid_size, depot=self.depot)
+    def _dist_to_depot(self) -> np.ndarray:
+        """Manhattan distance from the depot to every rack, as an (N,) array (cached; do not modify)."""
+        if self._dists is None:
+            self._dists = np.abs(self.pos_arr - np.asarray(self.depot)).sum(axis=1)
+        return self._dists
+
+    def _dist_stats(self) -> Tuple[int, int]:
+        if self._stats is None:
+            # Both terms come from one vectorized distance pass.
+            distances = self._dist_to_depot()
+            self._stats = (int(distances.sum()), int((distances < 5).sum()))
+        return self._stats
+
+    def _partial_delta(self, old_pos: Position, new_pos: Position) -> Tuple[int, int]:
+        """Change in (distance sum, congestion) when one rack moves from old_pos to new_pos."""
+        d_old = manhattan(self.depot, old_pos)
+        d_new = manhattan(self.depot, new_pos)
+        return d_new - d_old, (d_new < 5) - (d_old < 5)
+
+    def _apply_move(self, i: int, new_pos: Position) -> "RackLayout":
+        """Copy of this layout with rack i moved to new_pos, scored in O(1)."""
+        newpos = list(self.positions)
+        newpos[i] = new_pos
+        child = RackLayout(
+            positions=newpos,
+            grid_size=self.grid_size,
+            depot=self.depot,
+            parent_dists=self._dists,
+            moved_idx=i,
+            moved_pos=new_pos,
+        )
+        total, congestion = self._dist_stats()
+        d_total, d_congestion = self._partial_delta(self.positions[i], new_pos)
+        child._stats = (total + d_total, congestion + d_congestion)
+        return child
+
+    def objective_batch(self, position_stack: np.ndarray, lam: float = 2.0) -> np.ndarray:
+        """Objective for M candidate layouts at once.
+
+        position_stack has shape (M, N, 2); returns an (M,) array matching
+        `objective()` for each candidate, using this layout's depot.
+        """
+        stack = np.asarray(position_stack)
+        distances = np.abs(stack - np.asarray(self.depot)).sum(axis=-1)
+        avg = distances.sum(axis=-1) / stack.shape[1]
+        congestion = (distances < 5).sum(axis=-1)
+        return avg + lam * congestion / 1.0
 
-    def neighbors(self) -> List["RackLayout"]:
-        """Generate neighbors by moving one rack by +-1 in x or y, maintaining uniqueness and bounds."""
-        neighs: List[RackLayout] = []
+    def copy(self) -> "RackLayout":
+        dup = RackLayout(positions=list(self.positions), grid_size=self.grid_size, depot=self.depot)
+        dup._obj, dup._obj_lam = self._obj, self._obj_lam
+        dup._stats = self._stats
+        dup._dists = self._dists
+        return dup
+
+    def iter_moves(self) -> Iterator[Tuple[int, Position]]:
+        """Yield (rack index, new position) for every +-1 move in x or y that stays in bounds and unoccupied."""
         for i, (x, y) in enumerate(self.positions):
             for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
                 nx, ny = x + dx, y + dy
                 if not (0 <= nx < self.grid_size and 0 <= ny < self.grid_size):
                     continue
-                if (nx, ny) in self.positions:
+                if (nx, ny) in self._pos_set:
                     continue
-                newpos = list(self.positions)
-                newpos[i] = (nx, ny)
-                neighs.append(RackLayout(positions=newpos, grid_size=self.grid_size, depot=self.depot))
-        return neighs
+                yield i, (nx, ny)
+
+    def neighbors(self) -> List["RackLayout"]:
+        """Generate neighbors by moving one rack by +-1 in x or y, maintaining uniqueness and bounds."""
+        return [self._apply_move(i, p) for i, p in self.iter_moves()]
+
+    def propose_move(self) -> Tuple[int, Position] | None:
+        """Pick a random (rack index, empty cell) move, or None if the grid is full."""
+        blocked = len(self._pos_set) + (self.depot not in self._pos_set)
+        if blocked >= self.grid_size * self.grid_size:
+            return None
+        i = random.randrange(len(self.positions))
+        # Rejection-sample an empty cell instead of listing all of them.
+        while True:
+            cell = (random.randrange(self.grid_size), random.randrange(self.grid_size))
+            if cell not in self._pos_set and cell != self.depot:
+                return i, cell
 
     def mutate(self) -> "RackLayout":
         # random move of one rack to a random empty cell
-        all_cells = [(x, y) for x in range(self.grid_size) for y in range(self.grid_size)]
-        occupied = set(self.positions)
-        choices = [c for c in all_cells if c not in occupied and c != self.depot]
-        if not choices:
+        move = self.propose_move()
+        if move is None:
             return self.copy()
-        i = random.randrange(len(self.positions))
-        newpos = list(self.positions)
-        newpos[i] = random.choice(choices)
-        return RackLayout(positions=newpos, grid_size=self.grid_size, depot=self.depot)
+        return self._apply_move(*move)
 
 
 def pretty_print(layout: RackLayout) -> None:
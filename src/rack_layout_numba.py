@@ -0,0 +1,172 @@
+"""Numba-compiled objective kernels for RackLayout local search.
+
+Positions are an int32 (N, 2) array. The kernels reproduce
+`RackLayout.objective()` exactly: the distance sum and congestion count are
+accumulated as integers, then combined as sum / N + lam * congestion.
+"""
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+# Single-rack moves in the same order as RackLayout.neighbors().
+_DX = np.array([-1, 1, 0, 0], dtype=np.int64)
+_DY = np.array([0, 0, -1, 1], dtype=np.int64)
+
+
+@njit(cache=True)
+def _objective_nb(positions, depot_r, depot_c, lam):
+    """Objective of one layout given as an (N, 2) position array."""
+    n = positions.shape[0]
+    total = 0
+    congestion = 0
+    for i in range(n):
+        d = abs(positions[i, 0] - depot_r) + abs(positions[i, 1] - depot_c)
+        total += d
+        if d < 5:
+            congestion += 1
+    return total / n + lam * congestion
+
+
+@njit(cache=True)
+def _best_neighbor_nb(positions, depot_r, depot_c, grid_size, lam, occupied):
+    """Score every single-rack +-1 move and return the best one.
+
+    occupied is a reusable (grid_size, grid_size) uint8 scratch buffer.
+    Returns (rack_index, new_x, new_y, objective); rack_index is -1 when the
+    layout has no valid neighbor. Ties keep the first move in neighbors() order.
+    """
+    n = positions.shape[0]
+    occupied[:, :] = 0
+    total = 0
+    congestion = 0
+    for i in range(n):
+        occupied[positions[i, 0], positions[i, 1]] = 1
+        d = abs(positions[i, 0] - depot_r) + abs(positions[i, 1] - depot_c)
+        total += d
+        if d < 5:
+            congestion += 1
+
+    best_i, best_x, best_y = -1, 0, 0
+    best_obj = np.inf
+    for i in range(n):
+        x = positions[i, 0]
+        y = positions[i, 1]
+        d_old = abs(x - depot_r) + abs(y - depot_c)
+        for k in range(4):
+            nx = x + _DX[k]
+            ny = y + _DY[k]
+            if nx < 0 or ny < 0 or nx >= grid_size or ny >= grid_size:
+                continue
+            if occupied[nx, ny]:
+                continue
+            d_new = abs(nx - depot_r) + abs(ny - depot_c)
+            t = total - d_old + d_new
+            cg = congestion - (1 if d_old < 5 else 0) + (1 if d_new < 5 else 0)
+            obj = t / n + lam * cg
+            if obj < best_obj:
+                best_obj = obj
+                best_i, best_x, best_y = i, nx, ny
+    return best_i, best_x, best_y, best_obj
+
+
+@njit(cache=True)
+def _sa_inner(positions, depot_r, depot_c, grid_size, T0, alpha, max_iters, lam, seed):
+    """Simulated-annealing loop of `simulated_annealing` on a position array.
+
+    positions is updated in place. Moves relocate one random rack to a random
+    empty non-depot cell, scored incrementally like `RackLayout._partial_delta`.
+    Returns (best_positions, history, best_obj); history starts with the
+    initial objective and holds the best objective after each iteration.
+    """
+    np.random.seed(seed)
+    n = positions.shape[0]
+    occupied = np.zeros((grid_size, grid_size), dtype=np.uint8)
+    total = 0
+    congestion = 0
+    for i in range(n):
+        occupied[positions[i, 0], positions[i, 1]] = 1
+        d = abs(positions[i, 0] - depot_r) + abs(positions[i, 1] - depot_c)
+        total += d
+        if d < 5:
+            congestion += 1
+    depot_free = 1 if occupied[depot_r, depot_c] == 0 else 0
+    can_move = n + depot_free < grid_size * grid_size
+
+    current_obj = total / n + lam * congestion
+    best = positions.copy()
+    best_obj = current_obj
+    history = np.empty(max_iters + 1, dtype=np.float64)
+    history[0] = best_obj
+    length = 1
+    T = T0
+    for it in range(max_iters):
+        i = 0
+        nx = 0
+        ny = 0
+        d_total = 0
+        d_congestion = 0
+        if can_move:
+            i = np.random.randint(n)
+            # Rejection-sample an empty cell, as RackLayout.propose_move does.
+            while True:
+                nx = np.random.randint(grid_size)
+                ny = np.random.randint(grid_size)
+                if occupied[nx, ny] == 0 and not (nx == depot_r and ny == depot_c):
+                    break
+            d_old = abs(positions[i, 0] - depot_r) + abs(positions[i, 1] - depot_c)
+            d_new = abs(nx - depot_r) + abs(ny - depot_c)
+            d_total = d_new - d_old
+            d_congestion = (1 if d_new < 5 else 0) - (1 if d_old < 5 else 0)
+        candidate_obj = (total + d_total) / n + lam * (congestion + d_congestion)
+        delta = candidate_obj - current_obj
+        if delta < 0 or np.random.random() < np.exp(-delta / max(T, 1e-12)):
+            if can_move:
+                occupied[positions[i, 0], positions[i, 1]] = 0
+                occupied[nx, ny] = 1
+                positions[i, 0] = nx
+                positions[i, 1] = ny
+                total += d_total
+                congestion += d_congestion
+            current_obj = candidate_obj
+            if current_obj < best_obj:
+                best_obj = current_obj
+                best[:, :] = positions
+        history[length] = best_obj
+        length += 1
+        T *= alpha
+        if T < 1e-6:
+            break
+    return best, history[:length], best_obj
+
+
+@njit(cache=True)
+def _steepest_ascent_inner(positions, depot_r, depot_c, grid_size, lam, max_iters, start_obj):
+    """Steepest-ascent loop of `steepest_ascent` on a position array.
+
+    positions is updated in place. Each iteration applies the best neighbor
+    from `_best_neighbor_nb` while it strictly improves the objective.
+    Returns (history, final_obj); history starts with start_obj.
+    """
+    occupied = np.zeros((grid_size, grid_size), dtype=np.uint8)
+    history = np.empty(max_iters + 1, dtype=np.float64)
+    history[0] = start_obj
+    length = 1
+    current_obj = start_obj
+    for it in range(max_iters):
+        i, nx, ny, obj = _best_neighbor_nb(positions, depot_r, depot_c, grid_size, lam, occupied)
+        if i < 0 or not obj < current_obj:
+            break
+        positions[i, 0] = nx
+        positions[i, 1] = ny
+        current_obj = obj
+        history[length] = obj
+        length += 1
+    return history[:length], current_obj
+
+
+@njit(parallel=True, cache=True)
+def _evaluate_pop(pop, depot_r, depot_c, lam, objs_out):
+    """Objective of every layout in a (P, N, 2) position stack, written to objs_out."""
+    for i in prange(pop.shape[0]):
+        objs_out[i] = _objective_nb(pop[i], depot_r, depot_c, lam)
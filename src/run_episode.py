@@ -38,51 +38,77 @@ def manhattan(a: Tuple[int, int], b: Tuple[int, int]) -> int:
     return abs(a[0] - b[0]) + abs(a[1] - b[1])
 
 
-def run_episode(env: WarehouseEnv, agent: GreedyManhattanAgent, randomize: bool = False, max_steps: int | None = None) -> Dict:
-    """Run one episode and return frames and metrics."""
+def run_episode(
+    env: WarehouseEnv,
+    agent: GreedyManhattanAgent,
+    randomize: bool = False,
+    max_steps: int | None = None,
+    capture: bool = True,
+) -> Dict:
+    """Run one episode and return frames and metrics.
+
+    With capture=False no frames are rendered and the metric lists stay empty;
+    the summary fields (total_reward, steps, ...) are always filled.
+    """
     obs = env.reset(randomize=randomize)
-    agent.reset()
+    agent.reset(env)
 
-    frames: List[List[List[str]]] = [env.render_grid()]
-
-    # Initialize metrics so their lengths match `frames` (one entry per frame).
-    init_pick = manhattan(obs["robot_pos"], obs["pickup_pos"]) if obs.get("pickup_pos") is not None else 0
-    init_drop = manhattan(obs["robot_pos"], obs["dropoff_pos"]) if obs.get("dropoff_pos") is not None else 0
+    limit = max_steps or env.max_steps
+    # One slot per frame (initial state + each step), trimmed after the loop.
+    size = limit + 1 if capture else 0
+    frames: List[List[List[str]]] = [None] * size  # type: ignore[list-item]
     metrics = {
-        "rewards": [0.0],
-        "battery": [obs["battery"]],
-        "dist_pickup": [init_pick],
-        "dist_dropoff": [init_drop],
+        "rewards": [0.0] * size,
+        "battery": [0] * size,
+        "dist_pickup": [0] * size,
+        "dist_dropoff": [0] * size,
     }
+    rewards = metrics["rewards"]
+    battery = metrics["battery"]
+    dist_pickup = metrics["dist_pickup"]
+    dist_dropoff = metrics["dist_dropoff"]
+
+    # Metrics are initialized so their lengths match `frames` (one entry per frame).
+    if capture:
+        rp, pp, dp = obs["robot_pos"], obs.get("pickup_pos"), obs.get("dropoff_pos")
+        frames[0] = env.render_grid()
+        battery[0] = obs["battery"]
+        if pp is not None:
+            dist_pickup[0] = manhattan(rp, pp)
+        if dp is not None:
+            dist_dropoff[0] = manhattan(rp, dp)
 
     total_reward = 0.0
     steps = 0
     terminated = False
     truncated = False
 
-    limit = max_steps or env.max_steps
     while steps < limit:
         act = agent.select_action(obs, env)
         obs, r, terminated, truncated, info = env.step(act)
 
-        frames.append(env.render_grid())
         total_reward += r
-        metrics["rewards"].append(r)
-        metrics["battery"].append(obs["battery"])
-        # Distances
-        if obs.get("pickup_pos") is not None:
-            metrics["dist_pickup"].append(manhattan(obs["robot_pos"], obs["pickup_pos"]))
-        else:
-            metrics["dist_pickup"].append(0)
-        if obs.get("dropoff_pos") is not None:
-            metrics["dist_dropoff"].append(manhattan(obs["robot_pos"], obs["dropoff_pos"]))
-        else:
-            metrics["dist_dropoff"].append(0)
-
         steps += 1
+        if capture:
+            # Read each observation field once.
+            rp, pp, dp = obs["robot_pos"], obs.get("pickup_pos"), obs.get("dropoff_pos")
+            frames[steps] = env.render_grid()
+            rewards[steps] = r
+            battery[steps] = obs["battery"]
+            # Distances
+            if pp is not None:
+                dist_pickup[steps] = manhattan(rp, pp)
+            if dp is not None:
+                dist_dropoff[steps] = manhattan(rp, dp)
+
         if terminated or truncated:
             break
 
+    if capture:
+        del frames[steps + 1:]
+        for values in metrics.values():
+            del values[steps + 1:]
+
     return {
         "frames": frames,
         "metrics": metrics,
@@ -110,7 +136,8 @@ def main(argv=None):
         env = WarehouseEnv()
         agent = GreedyManhattanAgent(seed=(args.seed + i) if args.seed is not None else None)
         print(f"Episode {i}: randomize={args.randomize} seed={args.seed + i}")
-        res = run_episode(env, agent, randomize=args.randomize, max_steps=args.max_steps)
+        capture = args.replay or bool(args.save_svg)
+        res = run_episode(env, agent, randomize=args.randomize, max_steps=args.max_steps, capture=capture)
         results.append(res)
         print(f"  Steps: {res['steps']}, Total reward: {res['total_reward']:.2f}, Battery: {res['final_battery']}, terminated={res['terminated']}, truncated={res['truncated']}")
 
@@ -5,8 +5,15 @@ import math
 import random
 from typing import Tuple, List
 
+import numpy as np
+
 from rack_layout import RackLayout
 
+try:
+    from rack_layout_numba import _sa_inner
+except ImportError:
+    _sa_inner = None  # type: ignore
+
 
 def simulated_annealing(
     initial: RackLayout,
@@ -20,24 +27,67 @@ def simulated_annealing(
     Acceptance: Metropolis criterion
     """
     current = initial.copy()
-    best = current.copy()
-    T = T0
-    history = [current.objective()]
+    if _sa_inner is not None:
+        return _simulated_annealing_nb(current, T0, alpha, max_iters)
+    # Objective terms of `current` as integers; a move changes one rack, so
+    # candidates are scored in O(1) and only accepted moves build a layout.
+    total, congestion = current._dist_stats()
+    current_obj = current.objective()
+    best, best_obj = current, current_obj
+    # Acceptance draws and the cooling schedule T0 * alpha**it, computed up
+    # front; the generator is seeded from `random` to keep runs reproducible.
+    # Kept as lists so the loop works on plain floats, not numpy scalars.
+    U = np.random.default_rng(random.randrange(2**32)).random(max_iters).tolist()
+    T_sched = (T0 * np.power(alpha, np.arange(max_iters + 1, dtype=np.float64))).tolist()
+    history = [current_obj]
     for it in range(max_iters):
+        T = T_sched[it]
         # Propose random neighbor (single-rack random move)
-        candidate = current.mutate()
-        delta = candidate.objective() - current.objective()
-        if delta < 0 or random.random() < math.exp(-delta / max(T, 1e-12)):
-            current = candidate
-            if current.objective() < best.objective():
-                best = current.copy()
-        history.append(best.objective())
-        T *= alpha
-        if T < 1e-6:
+        move = current.propose_move()
+        if move is None:
+            d_total = d_congestion = 0
+        else:
+            i, new_pos = move
+            d_total, d_congestion = current._partial_delta(current.positions[i], new_pos)
+        candidate_obj = current._score(total + d_total, congestion + d_congestion)
+        delta = candidate_obj - current_obj
+        if delta < 0 or U[it] < math.exp(-delta / max(T, 1e-12)):
+            if move is not None:
+                current = current._apply_move(i, new_pos)
+                total += d_total
+                congestion += d_congestion
+            current_obj = candidate_obj
+            # Layouts are never modified in place, so best can share current.
+            if current_obj < best_obj:
+                best, best_obj = current, current_obj
+        history.append(best_obj)
+        if T_sched[it + 1] < 1e-6:
             break
     return best, history
 
 
+def _simulated_annealing_nb(
+    current: RackLayout, T0: float, alpha: float, max_iters: int
+) -> Tuple[RackLayout, List[float]]:
+    """Compiled-kernel version of the simulated_annealing loop.
+
+    The kernel's RNG is seeded from `random`, so `random.seed` still makes
+    runs reproducible, though not draw-for-draw identical to the Python loop.
+    """
+    depot_r, depot_c = current.depot
+    best_arr, history, best_obj = _sa_inner(
+        current.pos_arr.copy(), depot_r, depot_c, current.grid_size,
+        T0, alpha, max_iters, 2.0, random.randrange(2**32),
+    )
+    best = RackLayout(
+        positions=[tuple(p) for p in best_arr.tolist()],
+        grid_size=current.grid_size,
+        depot=current.depot,
+    )
+    best._obj, best._obj_lam = best_obj, 2.0
+    return best, history.tolist()
+
+
 if __name__ == "__main__":
     from rack_layout import RackLayout
     init = RackLayout()
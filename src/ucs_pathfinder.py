@@ -8,7 +8,10 @@ Returns: path (list of positions), statistics (nodes_expanded, frontier_size, ti
 from __future__ import annotations
 
 import heapq
+import itertools
+import math
 import time
+from collections import deque
 from typing import Dict, List, Optional, Tuple
 
 Position = Tuple[int, int]
@@ -35,13 +38,28 @@ class Node:
 
     def path(self) -> List[Position]:
         """Reconstruct path from start to this node."""
-        if self.parent is None:
-            return [self.position]
-        return self.parent.path() + [self.position]
+        out = []
+        n = self
+        while n is not None:
+            out.append(n.position)
+            n = n.parent
+        out.reverse()
+        return out
+
+
+def _reconstruct_path(parent_of: Dict[Position, Optional[Position]], goal: Position) -> List[Position]:
+    """Walk the parent map from goal back to start."""
+    out = []
+    pos: Optional[Position] = goal
+    while pos is not None:
+        out.append(pos)
+        pos = parent_of[pos]
+    out.reverse()
+    return out
 
 
 def uniformcost_search(
-    start: Position, goal: Position, env, max_expansions: int = 10000
+    start: Position, goal: Position, env, max_expansions: int = 10000, unit_cost: bool = True
 ) -> Tuple[Optional[List[Position]], Dict]:
     """
     Uniform Cost Search for pathfinding.
@@ -51,56 +69,116 @@ def uniformcost_search(
         goal: Goal position (r, c)
         env: WarehouseEnv instance (for grid checks)
         max_expansions: Safety limit to prevent infinite loops
+        unit_cost: Every move costs 1 (true for WarehouseEnv), so UCS reduces
+            to breadth-first search; pass False to force the priority queue
 
     Returns:
         (path, stats) where path is a list of positions or None if not found,
         stats includes: nodes_expanded, path_length, time_ms, frontier_peak
     """
+    if unit_cost:
+        return _bfs(start, goal, env, max_expansions)
+
     start_time = time.time()
-    start_node = Node(start, g=0)
 
-    frontier = []
-    heapq.heappush(frontier, (0, id(start_node), start_node))  # (cost, unique_id, node)
+    # Resolve moves, wall check and heap push once instead of per expansion.
+    moves = tuple(env.MOVE_DELTAS[act] for act in ("N", "E", "S", "W"))
+    is_wall = env._is_wall
+    push = heapq.heappush
+    counter = itertools.count()
 
-    explored: Dict[Position, float] = {}  # Maps position -> lowest cost found
+    # Heap holds plain (cost, tie-breaker, position) tuples; parents live in a map.
+    frontier = [(0, next(counter), start)]
+    parent_of: Dict[Position, Optional[Position]] = {start: None}
+    best_g: Dict[Position, int] = {start: 0}  # Lowest cost found per position
     frontier_peak = 1
     nodes_expanded = 0
 
     while frontier:
-        cost, _, node = heapq.heappop(frontier)
+        g, _, pos = heapq.heappop(frontier)
 
-        if node.position == goal:
+        if pos == goal:
             elapsed = time.time() - start_time
-            return node.path(), {
+            path = _reconstruct_path(parent_of, goal)
+            return path, {
                 "nodes_expanded": nodes_expanded,
-                "path_length": len(node.path()),
+                "path_length": len(path),
                 "time_ms": elapsed * 1000,
                 "frontier_peak": frontier_peak,
             }
 
-        if node.position in explored and explored[node.position] <= node.g:
-            continue  # Skip if cheaper path was found
+        if g > best_g[pos]:
+            continue  # Stale entry: a cheaper path was found after it was pushed
 
-        explored[node.position] = node.g
         nodes_expanded += 1
 
         if nodes_expanded > max_expansions:
             break
 
         # Expand neighbors (cardinal moves)
-        r, c = node.position
-        for act in ["N", "E", "S", "W"]:
-            dr, dc = env.MOVE_DELTAS[act]
+        r, c = pos
+        child_g = g + 1  # Each move costs 1
+        for dr, dc in moves:
             nr, nc = r + dr, c + dc
-            if env._is_wall(nr, nc):
+            if is_wall(nr, nc):
                 continue
             child_pos = (nr, nc)
-            child_g = node.g + 1  # Each move costs 1
+            if child_g < best_g.get(child_pos, math.inf):
+                best_g[child_pos] = child_g
+                parent_of[child_pos] = pos
+                push(frontier, (child_g, next(counter), child_pos))
 
-            # Only add if not explored or found a better path
-            if child_pos not in explored or explored[child_pos] > child_g:
-                child_node = Node(child_pos, parent=node, action=act, g=child_g)
-                heapq.heappush(frontier, (child_g, id(child_node), child_node))
+        frontier_peak = max(frontier_peak, len(frontier))
+
+    elapsed = time.time() - start_time
+    return None, {
+        "nodes_expanded": nodes_expanded,
+        "path_length": None,
+        "time_ms": elapsed * 1000,
+        "frontier_peak": frontier_peak,
+    }
+
+
+def _bfs(
+    start: Position, goal: Position, env, max_expansions: int = 10000
+) -> Tuple[Optional[List[Position]], Dict]:
+    """Breadth-first search: UCS on a unit-cost grid, with a FIFO queue instead of a heap."""
+    start_time = time.time()
+
+    moves = tuple(env.MOVE_DELTAS[act] for act in ("N", "E", "S", "W"))
+    is_wall = env._is_wall
+
+    frontier = deque([start])
+    parent_of: Dict[Position, Optional[Position]] = {start: None}  # Doubles as the visited set
+    frontier_peak = 1
+    nodes_expanded = 0
+
+    while frontier:
+        pos = frontier.popleft()
+
+        if pos == goal:
+            elapsed = time.time() - start_time
+            path = _reconstruct_path(parent_of, goal)
+            return path, {
+                "nodes_expanded": nodes_expanded,
+                "path_length": len(path),
+                "time_ms": elapsed * 1000,
+                "frontier_peak": frontier_peak,
+            }
+
+        nodes_expanded += 1
+
+        if nodes_expanded > max_expansions:
+            break
+
+        r, c = pos
+        for dr, dc in moves:
+            nr, nc = r + dr, c + dc
+            child_pos = (nr, nc)
+            if child_pos in parent_of or is_wall(nr, nc):
+                continue
+            parent_of[child_pos] = pos
+            frontier.append(child_pos)
 
         frontier_peak = max(frontier_peak, len(frontier))
 
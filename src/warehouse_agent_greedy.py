@@ -12,8 +12,11 @@ The agent is implemented as a simple class with a `select_action(obs, env)` meth
 so it can be used with the project's `WarehouseEnv`.
 """
 from collections import deque
+import math
 import random
-from typing import Deque, Tuple, Optional
+from typing import Deque, List, Tuple, Optional
+
+import numpy as np
 
 Action = str
 
@@ -21,17 +24,55 @@ Action = str
 class GreedyManhattanAgent:
     """Greedy Manhattan agent with loop detection and escape moves."""
 
+    # Cardinal moves and their (dr, dc) deltas, matching WarehouseEnv.MOVE_DELTAS.
+    _ACTIONS: Tuple[Action, ...] = ("N", "E", "S", "W")
+    _DELTAS: Tuple[Tuple[int, int], ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    # Break ties between equally good moves with the agent's RNG; when False,
+    # take the first best move and skip building the tie list.
+    tie_break_random: bool = True
+
     def __init__(self, loop_history_size: int = 10, escape_steps: int = 3, seed: Optional[int] = None):
         self.loop_history_size = loop_history_size
         self.recent: Deque[Tuple[int, int]] = deque(maxlen=loop_history_size)
         self.escape_steps = escape_steps
         self.escape_counter = 0
         self.rng = random.Random(seed)
+        # Padded wall bitmap, its flat bytes and row stride, and the env.grid
+        # they were built from (see _wall_bitmap).
+        self._walls: Optional[np.ndarray] = None
+        self._wall_bytes = b""
+        self._wall_stride = 0
+        self._walls_grid = None
+
+    def reset(self, env=None) -> None:
+        """Reset internal loop detector and escape counter.
 
-    def reset(self) -> None:
-        """Reset internal loop detector and escape counter."""
+        Passing env builds the wall bitmap now instead of on the first step.
+        """
         self.recent.clear()
         self.escape_counter = 0
+        if env is not None:
+            self._wall_bitmap(env)
+
+    def _wall_bitmap(self, env) -> np.ndarray:
+        """Walls of env as a uint8 array (1 = wall) with a one-cell wall border.
+
+        Index it as walls[r + 1, c + 1]; the border turns off-grid moves into
+        walls without a bounds check. Rebuilt only when env.grid is replaced.
+        """
+        if self._walls_grid is not env.grid:
+            walls = np.ones((env.height + 2, env.width + 2), dtype=np.uint8)
+            walls[1:-1, 1:-1] = [[env._is_wall(r, c) for c in range(env.width)] for r in range(env.height)]
+            self._walls = walls
+            self._wall_bytes = walls.tobytes()
+            self._wall_stride = env.width + 2
+            self._walls_grid = env.grid
+        return self._walls
+
+    def _wall_cells(self, env) -> Tuple[bytes, int]:
+        """Flat view of the wall bitmap: cell (r, c) is at (r + 1) * stride + c + 1."""
+        self._wall_bitmap(env)
+        return self._wall_bytes, self._wall_stride
 
     def select_action(self, obs: dict, env) -> Action:
         """Select an action given the observation (and environment for grid info).
@@ -54,22 +95,9 @@ class GreedyManhattanAgent:
         if (not has_item) and (dropoff == pos):
             # Try to choose a move that reduces distance to the pickup tile.
             if pickup is not None:
-                curr_dist_pickup = abs(pos[0] - pickup[0]) + abs(pos[1] - pickup[1])
-                best = []
-                best_d = curr_dist_pickup
-                for act in ["N", "E", "S", "W"]:
-                    dr, dc = env.MOVE_DELTAS[act]
-                    nr, nc = pos[0] + dr, pos[1] + dc
-                    if env._is_wall(nr, nc):
-                        continue
-                    d = abs(nr - pickup[0]) + abs(nc - pickup[1])
-                    if d < best_d:
-                        best_d = d
-                        best = [act]
-                    elif d == best_d and best:
-                        best.append(act)
-                if best:
-                    return self.rng.choice(best)
+                act = self._move_toward(pos, pickup, env)
+                if act is not None:
+                    return act
             # Fallback: random valid move
             return self._random_valid_move(pos, env)
 
@@ -78,22 +106,9 @@ class GreedyManhattanAgent:
             self.escape_counter -= 1
             target = pickup if not has_item else dropoff
             if target is not None:
-                curr = abs(pos[0] - target[0]) + abs(pos[1] - target[1])
-                best = []
-                best_d = curr
-                for act in ["N", "E", "S", "W"]:
-                    dr, dc = env.MOVE_DELTAS[act]
-                    nr, nc = pos[0] + dr, pos[1] + dc
-                    if env._is_wall(nr, nc):
-                        continue
-                    d = abs(nr - target[0]) + abs(nc - target[1])
-                    if d < best_d:
-                        best_d = d
-                        best = [act]
-                    elif d == best_d and best:
-                        best.append(act)
-                if best:
-                    return self.rng.choice(best)
+                act = self._move_toward(pos, target, env)
+                if act is not None:
+                    return act
             return self._random_valid_move(pos, env)
 
         # Loop detection: if we've been here recently, trigger escape behavior.
@@ -102,22 +117,9 @@ class GreedyManhattanAgent:
             # Prefer escaping toward the current goal (pickup if not carrying).
             goal_escape = pickup if not has_item else dropoff
             if goal_escape is not None:
-                curr = abs(pos[0] - goal_escape[0]) + abs(pos[1] - goal_escape[1])
-                best = []
-                best_d = curr
-                for act in ["N", "E", "S", "W"]:
-                    dr, dc = env.MOVE_DELTAS[act]
-                    nr, nc = pos[0] + dr, pos[1] + dc
-                    if env._is_wall(nr, nc):
-                        continue
-                    d = abs(nr - goal_escape[0]) + abs(nc - goal_escape[1])
-                    if d < best_d:
-                        best_d = d
-                        best = [act]
-                    elif d == best_d and best:
-                        best.append(act)
-                if best:
-                    return self.rng.choice(best)
+                act = self._move_toward(pos, goal_escape, env)
+                if act is not None:
+                    return act
             # Fallback: a random valid move
             return self._random_valid_move(pos, env)
 
@@ -130,42 +132,58 @@ class GreedyManhattanAgent:
             # No defined goal, just take a random valid move.
             return self._random_valid_move(pos, env)
 
-        # Compute current Manhattan distance.
-        curr_dist = abs(pos[0] - goal[0]) + abs(pos[1] - goal[1])
-
-        # Evaluate all cardinal moves and select those that reduce distance.
-        best_actions = []
-        best_dist = curr_dist
-        for act in ["N", "E", "S", "W"]:
-            dr, dc = env.MOVE_DELTAS[act]
-            nr, nc = pos[0] + dr, pos[1] + dc
-            # Skip invalid moves (walls / out-of-bounds).
-            if env._is_wall(nr, nc):
-                continue
-            d = abs(nr - goal[0]) + abs(nc - goal[1])
-            if d < best_dist:
-                best_dist = d
-                best_actions = [act]
-            elif d == best_dist and best_actions:
-                # Only add ties if we already have found a reducing move; this
-                # keeps behavior greedy while allowing random tie-breaks.
-                best_actions.append(act)
-
-        if best_actions:
-            # Choose randomly among equally-good moves for variety.
-            return self.rng.choice(best_actions)
+        act = self._move_toward(pos, goal, env)
+        if act is not None:
+            return act
 
         # No move reduces the distance (stuck): fallback to a random valid move.
         return self._random_valid_move(pos, env)
 
+    def _move_toward(self, pos: Tuple[int, int], target: Tuple[int, int], env) -> Optional[Action]:
+        """Move that gets closest to target, or None if no move reduces the distance.
+
+        Ties go to a random choice among the best moves for variety, or to the
+        first of them in N/E/S/W order when tie_break_random is off.
+        """
+        if self.tie_break_random:
+            best = self._best_moves_toward(pos, target, env)
+            return self.rng.choice(best) if best else None
+        walls, stride = self._wall_cells(env)
+        r, c = pos
+        tr, tc = target
+        base = (r + 1) * stride + c + 1
+        best_act = None
+        best_d = abs(r - tr) + abs(c - tc)
+        for act, (dr, dc) in zip(self._ACTIONS, self._DELTAS):
+            if walls[base + dr * stride + dc]:
+                continue
+            d = abs(r + dr - tr) + abs(c + dc - tc)
+            if d < best_d:
+                best_d = d
+                best_act = act
+        return best_act
+
+    def _best_moves_toward(self, pos: Tuple[int, int], target: Tuple[int, int], env) -> List[Action]:
+        """Valid moves that get closest to target, or [] if none reduces the distance."""
+        walls, stride = self._wall_cells(env)
+        r, c = pos
+        tr, tc = target
+        base = (r + 1) * stride + c + 1
+        # Distance after each move; walls / out-of-bounds stay at infinity.
+        ds = [math.inf] * 4
+        for k, (dr, dc) in enumerate(self._DELTAS):
+            if not walls[base + dr * stride + dc]:
+                ds[k] = abs(r + dr - tr) + abs(c + dc - tc)
+        min_d = min(ds)
+        if min_d >= abs(r - tr) + abs(c - tc):
+            return []
+        return [act for act, d in zip(self._ACTIONS, ds) if d == min_d]
+
     def _random_valid_move(self, pos: Tuple[int, int], env) -> Action:
         """Return a random valid cardinal move (or WAIT if nowhere to go)."""
-        valid = []
-        for act in ["N", "E", "S", "W"]:
-            dr, dc = env.MOVE_DELTAS[act]
-            nr, nc = pos[0] + dr, pos[1] + dc
-            if not env._is_wall(nr, nc):
-                valid.append(act)
+        walls, stride = self._wall_cells(env)
+        base = (pos[0] + 1) * stride + pos[1] + 1
+        valid = [act for act, (dr, dc) in zip(self._ACTIONS, self._DELTAS) if not walls[base + dr * stride + dc]]
         if not valid:
             return "WAIT"
         return self.rng.choice(valid)
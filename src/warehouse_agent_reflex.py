@@ -13,7 +13,9 @@ This agent is stateless (no history); it only uses the current percept (observat
 from __future__ import annotations
 
 import random
-from typing import Optional, Tuple
+from typing import Iterator, Optional, Tuple
+
+import numpy as np
 
 Action = str
 
@@ -21,12 +23,45 @@ Action = str
 class ReflexAgent:
     """Stateless reflex agent using simple condition-action rules."""
 
+    # Cardinal moves and their (dr, dc) deltas, matching WarehouseEnv.MOVE_DELTAS.
+    _ACTIONS: Tuple[Action, ...] = ("N", "E", "S", "W")
+    _DELTAS: Tuple[Tuple[int, int], ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    # Pick among distance-reducing fallback moves with the agent's RNG; when
+    # False, take the first one in N/E/S/W order.
+    tie_break_random: bool = True
+
     def __init__(self, seed: Optional[int] = None):
         self.rng = random.Random(seed)
-
-    def reset(self) -> None:
-        """No internal state to reset for reflex agent."""
-        return None
+        # Padded wall bitmap, its flat bytes and row stride, and the env.grid
+        # they were built from (see _wall_bitmap).
+        self._walls: Optional[np.ndarray] = None
+        self._wall_bytes = b""
+        self._wall_stride = 0
+        self._walls_grid = None
+
+    def reset(self, env=None) -> None:
+        """No per-episode state; passing env prebuilds the wall bitmap."""
+        if env is not None:
+            self._wall_bitmap(env)
+
+    def _wall_bitmap(self, env) -> np.ndarray:
+        """Walls of env as a uint8 array (1 = wall) with a one-cell wall border.
+
+        Index it as walls[r + 1, c + 1]. Rebuilt only when env.grid is replaced.
+        """
+        if self._walls_grid is not env.grid:
+            walls = np.ones((env.height + 2, env.width + 2), dtype=np.uint8)
+            walls[1:-1, 1:-1] = [[env._is_wall(r, c) for c in range(env.width)] for r in range(env.height)]
+            self._walls = walls
+            self._wall_bytes = walls.tobytes()
+            self._wall_stride = env.width + 2
+            self._walls_grid = env.grid
+        return self._walls
+
+    def _wall_cells(self, env) -> Tuple[bytes, int]:
+        """Flat view of the wall bitmap: cell (r, c) is at (r + 1) * stride + c + 1."""
+        self._wall_bitmap(env)
+        return self._wall_bytes, self._wall_stride
 
     def select_action(self, obs: dict, env) -> Action:
         pos: Tuple[int, int] = tuple(obs["robot_pos"])
@@ -62,33 +97,40 @@ class ReflexAgent:
             return preferred
 
         # If preferred invalid, try the other cardinal moves that reduce distance
-        candidates = []
-        for act in ["N", "E", "S", "W"]:
-            if not self._is_valid_move(act, pos, env):
-                continue
-            dr2, dc2 = env.MOVE_DELTAS[act]
-            nr, nc = r + dr2, c + dc2
-            d_after = abs(nr - tr) + abs(nc - tc)
-            d_before = abs(r - tr) + abs(c - tc)
-            if d_after < d_before:
-                candidates.append(act)
-
-        if candidates:
-            return self.rng.choice(candidates)
+        if self.tie_break_random:
+            candidates = list(self._moves_toward(pos, target, env))
+            if candidates:
+                return self.rng.choice(candidates)
+        else:
+            act = next(self._moves_toward(pos, target, env), None)
+            if act is not None:
+                return act
 
         # Nothing reduces distance or no valid reducing move: random valid move
         return self._random_valid_move(pos, env)
 
+    def _moves_toward(self, pos: Tuple[int, int], target: Tuple[int, int], env) -> Iterator[Action]:
+        """Valid moves that reduce the Manhattan distance to target, in N/E/S/W order."""
+        walls, stride = self._wall_cells(env)
+        r, c = pos
+        tr, tc = target
+        base = (r + 1) * stride + c + 1
+        d_before = abs(r - tr) + abs(c - tc)
+        return (
+            act
+            for act, (dr, dc) in zip(self._ACTIONS, self._DELTAS)
+            if not walls[base + dr * stride + dc] and abs(r + dr - tr) + abs(c + dc - tc) < d_before
+        )
+
     def _is_valid_move(self, act: str, pos: Tuple[int, int], env) -> bool:
         dr, dc = env.MOVE_DELTAS[act]
-        nr, nc = pos[0] + dr, pos[1] + dc
-        return not env._is_wall(nr, nc)
+        walls, stride = self._wall_cells(env)
+        return not walls[(pos[0] + dr + 1) * stride + pos[1] + dc + 1]
 
     def _random_valid_move(self, pos: Tuple[int, int], env) -> Action:
-        valid = []
-        for act in ["N", "E", "S", "W"]:
-            if self._is_valid_move(act, pos, env):
-                valid.append(act)
+        walls, stride = self._wall_cells(env)
+        base = (pos[0] + 1) * stride + pos[1] + 1
+        valid = [act for act, (dr, dc) in zip(self._ACTIONS, self._DELTAS) if not walls[base + dr * stride + dc]]
         if not valid:
             return "WAIT"
         return self.rng.choice(valid)
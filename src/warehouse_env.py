@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 import random
 from typing import Dict, List, Tuple, Union
+import numpy as np
 Action = Union[int, str]
 @dataclass
 class WarehouseState:
@@ -22,6 +23,9 @@ class WarehouseEnv:
         "S": (1, 0),
         "W": (0, -1),
     }
+    # MOVE_DELTAS as a (4, 2) array, rows in ACTIONS order (N, E, S, W), for
+    # scoring all four candidate cells with one vectorized expression.
+    MOVE_DELTAS_ARR = np.array([[-1, 0], [0, 1], [1, 0], [0, -1]], dtype=np.int8)
     def __init__(
         self,
         grid: List[str] | None = None,
@@ -18,6 +18,7 @@ variable per square per predicate:
 """
 
 from collections import deque
+from functools import lru_cache
 
 from z3 import Bool, Or, And, Not, Solver, unsat
 from hazardous_warehouse_env import (
@@ -49,27 +50,33 @@ def z3_entails(solver, query):
 # ---------------------------------------------------------------------------
 # Propositional Variable Helpers
 # ---------------------------------------------------------------------------
+# Cached so each square's symbol is built once and reused as the same AST.
 
+@lru_cache(maxsize=None)
 def damaged(x, y):
     """Z3 Bool variable: damaged floor at (x, y)."""
     return Bool(f'D_{x}_{y}')
 
 
+@lru_cache(maxsize=None)
 def forklift_at(x, y):
     """Z3 Bool variable: forklift at (x, y)."""
     return Bool(f'F_{x}_{y}')
 
 
+@lru_cache(maxsize=None)
 def creaking_at(x, y):
     """Z3 Bool variable: creaking perceived at (x, y)."""
     return Bool(f'C_{x}_{y}')
 
 
+@lru_cache(maxsize=None)
 def rumbling_at(x, y):
     """Z3 Bool variable: rumbling perceived at (x, y)."""
     return Bool(f'R_{x}_{y}')
 
 
+@lru_cache(maxsize=None)
 def safe(x, y):
     """Z3 Bool variable: square (x, y) is safe to enter."""
     return Bool(f'OK_{x}_{y}')
@@ -79,14 +86,15 @@ def safe(x, y):
 # Adjacency
 # ---------------------------------------------------------------------------
 
+@lru_cache(maxsize=None)
 def get_adjacent(x, y, width=4, height=4):
-    """Return the list of (x, y) positions adjacent to (x, y)."""
+    """Return the tuple of (x, y) positions adjacent to (x, y)."""
     result = []
     for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
         nx, ny = x + dx, y + dy
         if 1 <= nx <= width and 1 <= ny <= height:
             result.append((nx, ny))
-    return result
+    return tuple(result)
 
 
 # ---------------------------------------------------------------------------
@@ -141,6 +149,28 @@ def build_warehouse_kb(width=4, height=4):
     return solver
 
 
+# SMT-LIB text of the KB per (width, height), filled by build_warehouse_kb_cached.
+_KB_SMT2 = {}
+
+
+def build_warehouse_kb_cached(width=4, height=4):
+    """Return a fresh Solver holding the same constraints as build_warehouse_kb.
+
+    The KB for each grid size is built once and serialized with to_smt2();
+    later calls parse that text with from_string instead of rebuilding every
+    biconditional in Python.
+    """
+    key = (width, height)
+    smt2 = _KB_SMT2.get(key)
+    if smt2 is None:
+        solver = build_warehouse_kb(width, height)
+        _KB_SMT2[key] = solver.to_smt2()
+        return solver
+    solver = Solver()
+    solver.from_string(smt2)
+    return solver
+
+
 # ---------------------------------------------------------------------------
 # Turning Helpers
 # ---------------------------------------------------------------------------
@@ -201,7 +231,7 @@ class WarehouseKBAgent:
 
     def __init__(self, env):
         self.env = env
-        self.solver = build_warehouse_kb(env.width, env.height)
+        self.solver = build_warehouse_kb_cached(env.width, env.height)
         self.x = 1
         self.y = 1
         self.direction = Direction.EAST
@@ -0,0 +1,28 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC = str(Path(__file__).resolve().parents[1] / "src")
+if SRC not in sys.path:
+    sys.path.insert(0, SRC)
+
+from warehouse_env import WarehouseEnv
+
+
+@pytest.fixture(scope="module")
+def env_factory():
+    """Return a function handing out the module's shared WarehouseEnv.
+
+    The env is built once per test module. Each call restores its default
+    grid (tests may randomize it); tests call env.reset() as before, which
+    rebuilds the mutable state.
+    """
+    env = WarehouseEnv()
+    grid = env.grid
+
+    def make() -> WarehouseEnv:
+        env.grid = grid
+        return env
+
+    return make
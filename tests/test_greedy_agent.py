@@ -6,12 +6,11 @@ SRC = str(Path(__file__).resolve().parents[1] / "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
-from warehouse_env import WarehouseEnv
 from warehouse_agent_greedy import GreedyManhattanAgent
 
 
-def test_move_off_dropoff():
-    env = WarehouseEnv()
+def test_move_off_dropoff(env_factory):
+    env = env_factory()
     obs = env.reset()
     agent = GreedyManhattanAgent(seed=0)
 
@@ -29,8 +28,8 @@ def test_move_off_dropoff():
     assert not env._is_wall(nr, nc)
 
 
-def test_loop_detection_triggers_escape():
-    env = WarehouseEnv()
+def test_loop_detection_triggers_escape(env_factory):
+    env = env_factory()
     obs = env.reset()
     agent = GreedyManhattanAgent(seed=1)
 
@@ -43,3 +42,26 @@ def test_loop_detection_triggers_escape():
     # After selecting action while in recent history, escape_counter should be set.
     assert agent.escape_counter > 0
     assert act in {"N", "E", "S", "W"}
+
+
+def test_wall_bitmap_matches_env(env_factory):
+    env = env_factory()
+    env.reset(randomize=True)
+    agent = GreedyManhattanAgent(seed=0)
+    agent.reset(env)
+
+    walls = agent._wall_bitmap(env)
+    for r in range(-1, env.height + 1):
+        for c in range(-1, env.width + 1):
+            assert walls[r + 1, c + 1] == env._is_wall(r, c)
+
+
+def test_deterministic_tie_break_takes_first_best_move(env_factory):
+    env = env_factory()
+    obs = env.reset()
+    agent = GreedyManhattanAgent(seed=0)
+    agent.tie_break_random = False
+
+    best = agent._best_moves_toward(obs["robot_pos"], obs["pickup_pos"], env)
+    assert best
+    assert agent.select_action(obs, env) == best[0]
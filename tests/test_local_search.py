@@ -3,7 +3,7 @@ import random
 from rack_layout import RackLayout
 from hill_climbing import steepest_ascent
 from simulated_annealing import simulated_annealing
-from genetic_algorithm import genetic_algorithm
+from genetic_algorithm import genetic_algorithm, island_ga
 
 
 def test_hill_climbing_improves():
@@ -20,6 +20,16 @@ def test_simulated_annealing_improves():
     assert best.objective() <= init.objective()
 
 
+def test_simulated_annealing_history_tracks_best():
+    random.seed(3)
+    init = RackLayout()
+    best, hist = simulated_annealing(init, T0=1.0, alpha=0.99, max_iters=500)
+    assert len(set(best.positions)) == len(init.positions)
+    assert init.depot not in best.positions
+    assert RackLayout(positions=list(best.positions)).objective() == hist[-1]
+    assert all(a >= b for a, b in zip(hist, hist[1:]))
+
+
 def test_genetic_algorithm_returns_history():
     random.seed(2)
     best, hist = genetic_algorithm(pop_size=10, generations=50)
@@ -27,3 +37,10 @@ def test_genetic_algorithm_returns_history():
     assert len(hist) >= 1
     # history should record improvement potential: best value somewhere in history
     assert min(hist) <= hist[0]
+
+
+def test_island_ga_returns_history():
+    random.seed(3)
+    best, hist = island_ga(num_islands=2, pop_size=6, generations=6, migrate_every=3)
+    assert len(hist) == 7
+    assert best.objective() == hist[-1]
@@ -1,16 +1,17 @@
 import sys
 from pathlib import Path
 
+import numpy as np
+
 SRC = str(Path(__file__).resolve().parents[1] / "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
-from warehouse_env import WarehouseEnv
 from warehouse_agent_reflex import ReflexAgent
 
 
-def test_pick_and_drop_actions():
-    env = WarehouseEnv()
+def test_pick_and_drop_actions(env_factory):
+    env = env_factory()
     obs = env.reset()
     agent = ReflexAgent(seed=0)
 
@@ -27,8 +28,8 @@ def test_pick_and_drop_actions():
     assert agent.select_action(obs, env) == "DROP"
 
 
-def test_directional_rule_moves_toward_target():
-    env = WarehouseEnv()
+def test_directional_rule_moves_toward_target(env_factory):
+    env = env_factory()
     obs = env.reset()
     agent = ReflexAgent(seed=0)
 
@@ -42,8 +43,9 @@ def test_directional_rule_moves_toward_target():
     # reduce the Manhattan distance to the pickup.
     if act == "PICK":
         return
-    dr, dc = env.MOVE_DELTAS.get(act, (0, 0))
-    nr, nc = env.state.robot_pos[0] + dr, env.state.robot_pos[1] + dc
-    before = abs(env.state.robot_pos[0] - pr) + abs(env.state.robot_pos[1] - pc)
-    after = abs(nr - pr) + abs(nc - pc)
+    # Distance from the current cell (row 0) and after each of the four moves.
+    cells = np.asarray(env.state.robot_pos) + np.vstack([(0, 0), env.MOVE_DELTAS_ARR])
+    dists = np.abs(cells - (pr, pc)).sum(axis=1)
+    before = dists[0]
+    after = dists[env.ACTIONS.index(act) + 1] if act in env.MOVE_DELTAS else before
     assert after <= before, "Action should not increase distance to the pickup"
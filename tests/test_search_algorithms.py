@@ -5,14 +5,13 @@ SRC = str(Path(__file__).resolve().parents[1] / "src")
 if SRC not in sys.path:
     sys.path.insert(0, SRC)
 
-from warehouse_env import WarehouseEnv
 from ucs_pathfinder import uniformcost_search
-from astar_pathfinder import astar_search
+from astar_pathfinder import astar_search, bidirectional_astar
 
 
-def test_ucs_finds_path():
+def test_ucs_finds_path(env_factory):
     """Test that UCS finds a valid path."""
-    env = WarehouseEnv()
+    env = env_factory()
     obs = env.reset()
     path, stats = uniformcost_search((1, 1), obs["pickup_pos"], env)
     assert path is not None, "UCS should find a path"
@@ -21,9 +20,20 @@ def test_ucs_finds_path():
     assert path[-1] == obs["pickup_pos"], "Path should end at goal"
 
 
-def test_astar_finds_path():
+def test_ucs_bfs_matches_priority_queue(env_factory):
+    """The unit-cost BFS dispatch returns paths as short as heap-based UCS."""
+    env = env_factory()
+    obs = env.reset()
+    for goal in (obs["pickup_pos"], obs["dropoff_pos"]):
+        bfs_path, _ = uniformcost_search((1, 1), goal, env)
+        heap_path, _ = uniformcost_search((1, 1), goal, env, unit_cost=False)
+        assert bfs_path[0] == (1, 1) and bfs_path[-1] == goal
+        assert len(bfs_path) == len(heap_path)
+
+
+def test_astar_finds_path(env_factory):
     """Test that A* finds a valid path."""
-    env = WarehouseEnv()
+    env = env_factory()
     obs = env.reset()
     path, stats = astar_search((1, 1), obs["pickup_pos"], env)
     assert path is not None, "A* should find a path"
@@ -32,9 +42,9 @@ def test_astar_finds_path():
     assert path[-1] == obs["pickup_pos"], "Path should end at goal"
 
 
-def test_ucs_and_astar_find_optimal_paths():
+def test_ucs_and_astar_find_optimal_paths(env_factory):
     """Test that UCS and A* find paths of identical length (both optimal)."""
-    env = WarehouseEnv()
+    env = env_factory()
     obs = env.reset()
     target = obs["pickup_pos"]
 
@@ -45,9 +55,9 @@ def test_ucs_and_astar_find_optimal_paths():
     assert len(ucs_path) == len(astar_path), "Both should find paths of equal length (optimality)"
 
 
-def test_astar_is_more_efficient():
+def test_astar_is_more_efficient(env_factory):
     """Test that A* expands fewer or equal nodes compared to UCS (on average)."""
-    env = WarehouseEnv()
+    env = env_factory()
     obs = env.reset()
     target = obs["pickup_pos"]
 
@@ -58,3 +68,60 @@ def test_astar_is_more_efficient():
     # Allow for some variance, but A* should generally be better or equal
     assert astar_stats["nodes_expanded"] <= ucs_stats["nodes_expanded"] * 1.5, \
         "A* should not expand drastically more nodes than UCS"
+
+
+def test_astar_kernel_matches_python_search(env_factory):
+    """The compiled Manhattan path and the generic Python loop agree."""
+    env = env_factory()
+    obs = env.reset()
+    for goal in (obs["pickup_pos"], obs["dropoff_pos"]):
+        fast_path, fast_stats = astar_search((1, 1), goal, env)
+        slow_path, slow_stats = astar_search(
+            (1, 1), goal, env, heuristic=lambda p, g: abs(p[0] - g[0]) + abs(p[1] - g[1])
+        )
+        assert fast_path == slow_path
+        assert fast_stats["nodes_expanded"] == slow_stats["nodes_expanded"]
+
+
+def test_astar_cache_matches_uncached_search(env_factory):
+    """Cached A* results equal a fresh search and are safe to mutate."""
+    env = env_factory()
+    obs = env.reset()
+    target = obs["pickup_pos"]
+
+    first, _ = astar_search((1, 1), target, env)
+    first.append((0, 0))
+    cached, _ = astar_search((1, 1), target, env)
+    fresh, _ = astar_search((1, 1), target, env, use_cache=False)
+    assert cached == fresh
+
+
+def test_bidirectional_astar_finds_optimal_path(env_factory):
+    """Bidirectional A* returns a valid path as short as A*'s."""
+    env = env_factory()
+    obs = env.reset()
+    target = obs["dropoff_pos"]
+
+    path, _ = bidirectional_astar((1, 1), target, env)
+    astar_path, _ = astar_search((1, 1), target, env)
+
+    assert path is not None
+    assert path[0] == (1, 1) and path[-1] == target
+    assert len(path) == len(astar_path)
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        assert abs(r1 - r2) + abs(c1 - c2) == 1
+        assert not env._is_wall(r2, c2)
+
+
+def test_heap4_pops_in_sorted_order():
+    """The 4-ary heap used by the A* kernel behaves like heapq."""
+    import random
+
+    from heap4 import pop4, push4
+
+    rng = random.Random(0)
+    items = [(rng.randrange(20), i) for i in range(200)]
+    heap = []
+    for item in items:
+        push4(heap, item)
+    assert [pop4(heap) for _ in items] == sorted(items)